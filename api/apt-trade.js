@@ -1,15 +1,19 @@
 const https = require("https");
 
+const ITEM_RE = /<item>([\s\S]*?)<\/item>/g;
+const TAG_RE = /<(\w+)>([\s\S]*?)<\/\1>/g;
+
 function parseXML(xml) {
   const items = [];
-  const itemRegex = /<item>([\s\S]*?)<\/item>/g;
+  ITEM_RE.lastIndex = 0;
   let match;
-  while ((match = itemRegex.exec(xml)) !== null) {
-    const block = match[1];
-    const get = (tag) => {
-      const m = block.match(new RegExp(`<${tag}>([\\s\\S]*?)<\\/${tag}>`));
-      return m ? m[1].trim() : "";
-    };
+  while ((match = ITEM_RE.exec(xml)) !== null) {
+    // item 안의 태그를 한 번에 훑어서 맵으로 (태그마다 new RegExp 하지 않도록)
+    const f = {};
+    TAG_RE.lastIndex = 0;
+    let t;
+    while ((t = TAG_RE.exec(match[1])) !== null) f[t[1]] = t[2].trim();
+    const get = (tag) => f[tag] || "";
     items.push({
       aptName: get("aptNm"),
       price: get("dealAmount").replace(/,/g, "").trim(),
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""수집 결과 조인 - 구별 x 월별 파생지표(전세가율/금리 반영 월상환액/미분양 소진 개월수) 생성
+
+trade-trend / rent-trend / interest-rate / unsold-district 를
+(구, 월) 기준으로 맞춘 월 인덱스 배열로 묶고, 지표마다 작은 파일 하나씩 public/data/views/ 에 쓴다.
+입력값이 바뀐 달만 다시 계산 (views/_state.json 에 월별 입력 해시 저장).
+"""
+
+import json, os, hashlib, subprocess
+from datetime import datetime
+
+REPO_DIR = os.path.expanduser("~/realestate-valley")
+DATA_DIR = os.path.join(REPO_DIR, "public/data")
+VIEW_DIR = os.path.join(DATA_DIR, "views")
+STATE_PATH = os.path.join(VIEW_DIR, "_state.json")
+
+SEOUL = "서울"
+LTV = 0.5            # 대출 비율 (평균 거래가 기준)
+LOAN_MONTHS = 360    # 30년 원리금균등
+
+def load(name):
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+def align(pairs, idx):
+    """[(month, value), ...] -> months 순서 배열 (없는 달은 None)"""
+    arr = [None] * len(idx)
+    for m, v in pairs:
+        if m in idx:
+            arr[idx[m]] = v
+    return arr
+
+def weighted(avgs, counts):
+    """구별 평균/건수 배열들 -> 서울 전체 가중평균 배열"""
+    out = []
+    for i in range(len(avgs[0])):
+        num = den = 0
+        for a, c in zip(avgs, counts):
+            if a[i] and c[i]:
+                num += a[i] * c[i]
+                den += c[i]
+        out.append(round(num / den) if den else None)
+    return out
+
+def total(arrays):
+    """구별 배열들 -> 서울 합계 배열 (모든 구가 비어 있는 달은 None)"""
+    out = []
+    for vals in zip(*arrays):
+        vals = [v for v in vals if v is not None]
+        out.append(sum(vals) if vals else None)
+    return out
+
+def load_sources():
+    trade = load("trade-trend.json")
+    rent = load("rent-trend.json")
+    rate = load("interest-rate.json")
+    unsold = load("unsold-district.json")
+
+    months = sorted(set(trade["months"]) | set(rent["months"]))
+    idx = {m: i for i, m in enumerate(months)}
+    districts = list(trade["districts"].keys())
+
+    src = {"months": months, "districts": districts,
+           "trade_avg": {}, "trade_count": {}, "jeonse_avg": {}, "jeonse_count": {}, "unsold": {}}
+    for gu in districts:
+        rows = trade["districts"][gu]["monthly"]
+        src["trade_avg"][gu] = align([(r["month"], r["avg"] or None) for r in rows], idx)
+        src["trade_count"][gu] = align([(r["month"], r["count"]) for r in rows], idx)
+        rows = rent["districts"].get(gu, [])
+        src["jeonse_avg"][gu] = align([(r["month"], r["jeonse_avg"] or None) for r in rows], idx)
+        src["jeonse_count"][gu] = align([(r["month"], r["jeonse_count"]) for r in rows], idx)
+        src["unsold"][gu] = align(unsold["data"].get(gu, {}).items(), idx)
+
+    # 서울 전체 행
+    src["trade_avg"][SEOUL] = weighted([src["trade_avg"][g] for g in districts], [src["trade_count"][g] for g in districts])
+    src["jeonse_avg"][SEOUL] = weighted([src["jeonse_avg"][g] for g in districts], [src["jeonse_count"][g] for g in districts])
+    src["trade_count"][SEOUL] = total([src["trade_count"][g] for g in districts])
+    src["unsold"][SEOUL] = total([src["unsold"][g] for g in districts])
+
+    # 금리는 서울 단일 시계열 - 모든 구에 공통 적용
+    src["mortgage_rate"] = align([(r["month"], r["value"]) for r in rate.get("주택담보대출", [])], idx)
+    return src
+
+# ── 지표 계산 ──
+
+def jeonse_ratio(sale, jeonse):
+    if not sale or not jeonse: return None
+    return round(jeonse / sale * 100, 1)
+
+def monthly_payment(sale, rate):
+    """평균 거래가 x LTV 를 해당 월 주담대 금리로 30년 원리금균등 상환할 때 월 상환액 (만원)"""
+    if not sale or rate is None: return None
+    loan = sale * LTV
+    r = rate / 100 / 12
+    if r == 0: return round(loan / LOAN_MONTHS, 1)
+    return round(loan * r / (1 - (1 + r) ** -LOAN_MONTHS), 1)
+
+def months_of_inventory(unsold, count):
+    """미분양 재고를 그달 매매 거래량으로 다 소진하는 데 걸리는 개월수"""
+    if unsold is None or not count: return None
+    return round(unsold / count, 2)
+
+VIEWS = {
+    "jeonse-ratio": {
+        "title": "전세가율 (전세 평균 보증금 / 매매 평균가)",
+        "unit": "%",
+        "inputs": lambda s, gu, i: (s["trade_avg"][gu][i], s["jeonse_avg"][gu][i]),
+        "calc": jeonse_ratio,
+    },
+    "affordability": {
+        "title": f"평균 거래가 LTV {int(LTV*100)}% 주담대 월 상환액 (30년)",
+        "unit": "만원/월",
+        "inputs": lambda s, gu, i: (s["trade_avg"][gu][i], s["mortgage_rate"][i]),
+        "calc": monthly_payment,
+    },
+    "months-of-inventory": {
+        "title": "미분양 재고 / 월 매매 거래량 (소진 개월수)",
+        "unit": "개월",
+        "inputs": lambda s, gu, i: (s["unsold"][gu][i], s["trade_count"][gu][i]),
+        "calc": months_of_inventory,
+    },
+}
+
+def digest(obj):
+    return hashlib.md5(json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+def build_view(name, spec, src, prev, prev_hashes):
+    """입력 해시가 그대로인 달은 이전 결과를 재사용, 바뀐 달만 계산"""
+    months = src["months"]
+    rows = src["districts"] + [SEOUL]
+    prev_idx = {m: i for i, m in enumerate(prev.get("months", []))} if prev else {}
+    prev_series = prev.get("districts", {}) if prev else {}
+
+    series = {gu: [None] * len(months) for gu in rows}
+    hashes, changed = {}, []
+    for i, m in enumerate(months):
+        inputs = {gu: spec["inputs"](src, gu, i) for gu in rows}
+        h = digest(inputs)
+        hashes[m] = h
+        j = prev_idx.get(m)
+        if j is not None and prev_hashes.get(m) == h and all(gu in prev_series for gu in rows):
+            for gu in rows:
+                series[gu][i] = prev_series[gu][j]
+            continue
+        changed.append(m)
+        for gu in rows:
+            series[gu][i] = spec["calc"](*inputs[gu])
+
+    view = {
+        "updated": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "view": name,
+        "title": spec["title"],
+        "unit": spec["unit"],
+        "months": months,
+        "districts": series,
+    }
+    return view, hashes, changed
+
+def main():
+    src = load_sources()
+    print(f"views: {src['months'][0]} ~ {src['months'][-1]} ({len(src['months'])}개월 x {len(src['districts'])}구)\n")
+
+    os.makedirs(VIEW_DIR, exist_ok=True)
+    state = {}
+    if os.path.exists(STATE_PATH):
+        with open(STATE_PATH, encoding="utf-8") as f:
+            state = json.load(f)
+
+    written = []
+    state = {name: h for name, h in state.items() if name in VIEWS}
+
+    for name, spec in VIEWS.items():
+        path = os.path.join(VIEW_DIR, f"{name}.json")
+        prev = None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                prev = json.load(f)
+        view, hashes, changed = build_view(name, spec, src, prev, state.get(name, {}))
+        state[name] = hashes
+        if prev and not changed and prev.get("months") == view["months"]:
+            print(f"  {name}: unchanged")
+            continue
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(view, f, ensure_ascii=False, separators=(",", ":"))
+        written.append(path)
+        print(f"  {name}: {len(changed)}개월 재계산 -> {os.path.getsize(path):,} bytes")
+
+    with open(STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+    if not written:
+        print("\nNo changes")
+        return
+
+    print("\nGit push...")
+    now = datetime.now()
+    os.chdir(REPO_DIR)
+    subprocess.run(["git", "pull", "origin", "master", "--rebase"], check=True)
+    subprocess.run(["git", "add", "public/data/views", "scripts/build-views.py"], check=True)
+    rc = subprocess.run(["git", "diff", "--cached", "--quiet"])
+    if rc.returncode != 0:
+        subprocess.run(["git", "commit", "-m", f"파생지표 갱신 ({now.strftime('%Y-%m-%d')})"], check=True)
+        subprocess.run(["git", "push", "origin", "master"], check=True)
+        print("Done!")
+    else:
+        print("No changes")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 
 import json, re, os, subprocess, urllib.request, urllib.parse
 from datetime import datetime
+from delta_feed import emit_delta
 
 KOSIS_KEY = "MzRkMGRlMGQ0MzhjOGMyOGE0YTc2NDdmMTdmZTA1MTQ="
 BASE_URL = "https://kosis.kr/openapi/Param/statisticsParameterData.do"
@@ -71,12 +72,13 @@ def main():
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
+    emit_delta(out_path, result)
     print(f"\nSaved: {out_path}")
 
     print("\nGit push...")
     os.chdir(REPO_DIR)
     subprocess.run(["git","pull","origin","master","--rebase"], check=True)
-    subprocess.run(["git","add","public/data/housing-supply.json","scripts/collect-housing-supply.py"], check=True)
+    subprocess.run(["git","add","public/data/deltas","public/data/housing-supply.json","scripts/collect-housing-supply.py"], check=True)
     rc = subprocess.run(["git","diff","--cached","--quiet"])
     if rc.returncode != 0:
         subprocess.run(["git","commit","-m",f"주택 인허가 데이터 ({now.strftime('%Y-%m-%d')})"], check=True)
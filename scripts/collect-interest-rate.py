@@ -3,6 +3,7 @@
 
 import json, urllib.request, subprocess, os
 from datetime import datetime
+from delta_feed import emit_delta
 
 ECOS_KEY = "O54TU8XB4EJAC3SPME3S"
 ECOS_URL = "https://ecos.bok.or.kr/api/StatisticSearch"
@@ -75,13 +76,14 @@ def main():
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
+    emit_delta(out_path, result)
     print(f"\n🎉 수집 완료! 저장: {out_path}")
 
     # Git push
     print("\n📤 Git push 중...")
     os.chdir(REPO_DIR)
     subprocess.run(["git", "pull", "origin", "master", "--rebase"], check=True)
-    subprocess.run(["git", "add", "public/data/interest-rate.json"], check=True)
+    subprocess.run(["git", "add", "public/data/deltas", "public/data/interest-rate.json"], check=True)
     rc = subprocess.run(["git", "diff", "--cached", "--quiet"])
     if rc.returncode != 0:
         subprocess.run(["git", "commit", "-m", f"금리 데이터 갱신 ({now.strftime('%Y-%m-%d')})"], check=True)
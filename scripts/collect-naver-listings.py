@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""네이버 부동산 매물 수집 - 구 경계 박스를 타일로 나눠 병렬 크롤링 + 매물번호 중복 제거
+
+api/naver-land.js 는 좌표 하나 주변 ±0.005° 만 조회해서 구 전체 매물 수를 알 수 없다.
+구마다 경계 박스를 articleList 클러스터 줌(z=15) 한 화면 크기 타일로 자르고
+(이웃 타일과 조금씩 겹치게), cortarNo 로 해당 구만 걸러서 전 타일을 동시에 긁는다.
+겹치는 구간에서 중복으로 잡힌 매물은 atclNo 로 한 번만 센다.
+페이지 상한에 걸린 (매물이 몰린) 타일은 4등분해서 다시 긁는다.
+
+결과: public/data/naver-listings.json (구별 매매/전세/월세 건수 + 최근 매물 샘플)
+
+  python collect-naver-listings.py                        # 실제 수집 + git push
+  python collect-naver-listings.py --base-url http://127.0.0.1:8765 --out /tmp/n.json --no-push
+      (python naver_fixture.py 8765 로 띄운 로컬 픽스처 서버 대상)
+"""
+
+import argparse, json, os, subprocess, sys, threading, time, urllib.request, urllib.parse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+
+BASE_URL = "https://m.land.naver.com"
+REPO_DIR = os.path.expanduser("~/realestate-valley")
+OUT_FILE = "public/data/naver-listings.json"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Referer": "https://m.land.naver.com/",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+ZOOM = 15
+TILE_DEG = 0.01        # z=15 에서 articleList 한 화면 (naver-land.js 의 ±0.005 박스와 같은 크기)
+OVERLAP = 0.1          # 타일 가장자리 매물 누락 방지용 겹침 비율
+MAX_PAGES = 30         # 타일당 페이지 상한 (20건/페이지)
+MAX_SPLIT = 3          # 상한에 걸린 타일 4등분 최대 깊이 (0.01° -> 0.00125°)
+WORKERS = 8
+RATE = 5.0             # 초당 요청 수 (전체 워커 합산)
+SAMPLE = 50            # 구별 저장할 매물 샘플 수
+
+TRADE_TYPES = {"A1": "sale", "B1": "lease", "B2": "rent"}
+TRADE_NAMES = {"매매": "sale", "전세": "lease", "월세": "rent"}
+
+# 구 코드(법정동 앞 5자리), 중심 좌표, 경계 박스 (btm, lft, top, rgt) - 대략값, 겹침은 cortarNo 가 걸러줌
+DISTRICTS = {
+    "종로구": ("11110", 37.5735, 126.9790, (37.565, 126.950, 37.633, 127.025)),
+    "중구": ("11140", 37.5641, 126.9979, (37.543, 126.965, 37.572, 127.025)),
+    "용산구": ("11170", 37.5326, 126.9905, (37.515, 126.945, 37.556, 127.015)),
+    "성동구": ("11200", 37.5634, 127.0369, (37.530, 127.010, 37.574, 127.075)),
+    "광진구": ("11215", 37.5385, 127.0823, (37.527, 127.060, 37.570, 127.115)),
+    "동대문구": ("11230", 37.5744, 127.0400, (37.560, 127.020, 37.607, 127.078)),
+    "중랑구": ("11260", 37.6066, 127.0927, (37.577, 127.070, 37.622, 127.115)),
+    "성북구": ("11290", 37.5894, 127.0167, (37.575, 126.980, 37.630, 127.075)),
+    "강북구": ("11305", 37.6397, 127.0255, (37.610, 126.985, 37.680, 127.050)),
+    "도봉구": ("11320", 37.6688, 127.0471, (37.630, 127.010, 37.700, 127.060)),
+    "노원구": ("11350", 37.6542, 127.0568, (37.610, 127.040, 37.695, 127.115)),
+    "은평구": ("11380", 37.6027, 126.9291, (37.575, 126.895, 37.665, 126.965)),
+    "서대문구": ("11410", 37.5791, 126.9368, (37.555, 126.905, 37.605, 126.970)),
+    "마포구": ("11440", 37.5663, 126.9019, (37.530, 126.860, 37.590, 126.965)),
+    "양천구": ("11470", 37.5170, 126.8664, (37.505, 126.825, 37.555, 126.890)),
+    "강서구": ("11500", 37.5510, 126.8495, (37.530, 126.765, 37.600, 126.885)),
+    "구로구": ("11530", 37.4954, 126.8874, (37.475, 126.810, 37.515, 126.905)),
+    "금천구": ("11545", 37.4569, 126.8955, (37.435, 126.875, 37.485, 126.920)),
+    "영등포구": ("11560", 37.5264, 126.8962, (37.500, 126.880, 37.545, 126.950)),
+    "동작구": ("11590", 37.5124, 126.9393, (37.475, 126.905, 37.515, 126.985)),
+    "관악구": ("11620", 37.4784, 126.9516, (37.455, 126.900, 37.495, 126.985)),
+    "서초구": ("11650", 37.4837, 127.0324, (37.430, 126.980, 37.520, 127.075)),
+    "강남구": ("11680", 37.5172, 127.0473, (37.455, 127.015, 37.535, 127.120)),
+    "송파구": ("11710", 37.5145, 127.1059, (37.465, 127.065, 37.530, 127.180)),
+    "강동구": ("11740", 37.5301, 127.1238, (37.520, 127.110, 37.575, 127.185)),
+}
+
+class RateLimiter:
+    """전체 스레드 공용 - 요청 간격을 1/rate 초 이상으로"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            at = max(now, self.next_at)
+            self.next_at = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+def tiles(bbox, size=TILE_DEG, overlap=OVERLAP):
+    """경계 박스 -> 겹치는 타일 (btm, lft, top, rgt) 목록"""
+    btm, lft, top, rgt = bbox
+    pad = size * overlap
+    out = []
+    lat = btm
+    while lat < top:
+        lng = lft
+        while lng < rgt:
+            out.append((round(lat - pad, 7), round(lng - pad, 7),
+                        round(min(lat + size, top) + pad, 7), round(min(lng + size, rgt) + pad, 7)))
+            lng += size
+        lat += size
+    return out
+
+def split(tile, overlap=OVERLAP):
+    """타일 -> 살짝 겹치는 4등분 타일"""
+    btm, lft, top, rgt = tile
+    mid_lat, mid_lng = (btm + top) / 2, (lft + rgt) / 2
+    pad = (top - btm) / 2 * overlap
+    return [(round(b - pad, 7), round(l - pad, 7), round(t + pad, 7), round(r + pad, 7))
+            for b, t in ((btm, mid_lat), (mid_lat, top)) for l, r in ((lft, mid_lng), (mid_lng, rgt))]
+
+def fetch_page(base_url, cortar_no, tile, page, limiter, trad_tp="A1:B1:B2", retries=3):
+    btm, lft, top, rgt = tile
+    params = {
+        "rletTpCd": "APT", "tradTpCd": trad_tp, "z": str(ZOOM),
+        "lat": f"{(btm + top) / 2:.7f}", "lon": f"{(lft + rgt) / 2:.7f}",
+        "btm": f"{btm:.7f}", "lft": f"{lft:.7f}", "top": f"{top:.7f}", "rgt": f"{rgt:.7f}",
+        "spcMin": "0", "spcMax": "900000000", "showR0": "", "cortarNo": cortar_no, "page": str(page),
+    }
+    url = f"{base_url}/cluster/ajax/articleList?" + urllib.parse.urlencode(params)
+    for attempt in range(retries):
+        limiter.wait()
+        try:
+            req = urllib.request.Request(url, headers=HEADERS)
+            with urllib.request.urlopen(req, timeout=15) as r:
+                return json.loads(r.read().decode("utf-8"))
+        except Exception as e:
+            if attempt < retries - 1:
+                time.sleep(2 * (attempt + 1))
+            else:
+                print(f"  fail: {cortar_no} {tile} p{page}: {e}")
+                return None
+
+def crawl_tile(base_url, cortar_no, tile, limiter):
+    """타일 한 칸의 모든 페이지 -> (매물 리스트, 페이지 상한에 걸렸는지, 요청 실패로 중단됐는지)"""
+    items = []
+    for page in range(1, MAX_PAGES + 1):
+        data = fetch_page(base_url, cortar_no, tile, page, limiter)
+        if not data:
+            return items, False, True
+        items.extend(data.get("body") or [])
+        if not data.get("more"):
+            return items, False, False
+    return items, True, False
+
+def simplify(item):
+    """naver-land.js 와 같은 필드 이름"""
+    no = item.get("atclNo")
+    return {
+        "id": no,
+        "name": item.get("atclNm") or "",
+        "complex": item.get("cpNm") or "",
+        "type": item.get("rletTpNm") or "",
+        "trade": item.get("tradTpNm") or "",
+        "price": item.get("hanPrc") or "",
+        "deposit": item.get("rentPrc") or "",
+        "area1": item.get("spc1") or "",
+        "area2": item.get("spc2") or "",
+        "floor": item.get("flrInfo") or "",
+        "direction": item.get("direction") or "",
+        "desc": item.get("atclFetrDesc") or "",
+        "tags": item.get("tagList") or [],
+        "lat": item.get("lat"),
+        "lng": item.get("lng"),
+        "confirm": item.get("cfmYmd") or "",
+        "link": f"https://new.land.naver.com/houses/{no}" if no else "",
+    }
+
+def trade_kind(item):
+    return TRADE_TYPES.get(item.get("tradTpCd")) or TRADE_NAMES.get(item.get("tradTpNm"))
+
+def crawl(base_url=BASE_URL, workers=WORKERS, rate=RATE):
+    limiter = RateLimiter(rate)
+    jobs = [(gu, code + "00000", tile) for gu, (code, _, _, bbox) in DISTRICTS.items() for tile in tiles(bbox)]
+    print(f"tiles: {len(jobs)} ({len(DISTRICTS)}구, {TILE_DEG}° x {TILE_DEG}°, workers={workers}, {rate}/s)\n")
+
+    seen = {gu: {} for gu in DISTRICTS}    # gu -> {atclNo: item}
+    raw_count, done, splits = 0, 0, 0
+    failed = {}    # gu -> 실패한 타일 수 (상한에 걸린 채 더 못 쪼갠 타일 포함)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def submit(gu, cortar, tile, depth):
+            return pool.submit(crawl_tile, base_url, cortar, tile, limiter), (gu, cortar, tile, depth)
+        pending = dict(submit(gu, cortar, tile, 0) for gu, cortar, tile in jobs)
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                gu, cortar, tile, depth = pending.pop(fut)
+                items, hit_cap, tile_failed = fut.result()
+                if hit_cap and depth < MAX_SPLIT:
+                    # 상한 뒤 매물은 안 보이므로 4등분해서 다시 - 이미 받은 매물은 atclNo 로 중복 제거
+                    splits += 1
+                    pending.update(submit(gu, cortar, sub, depth + 1) for sub in split(tile))
+                elif hit_cap or tile_failed:
+                    if hit_cap:
+                        print(f"  warn: {gu} {tile} still hit MAX_PAGES={MAX_PAGES} at depth {depth}")
+                    failed[gu] = failed.get(gu, 0) + 1
+                raw_count += len(items)
+                for it in items:
+                    no = it.get("atclNo")
+                    if no and no not in seen[gu]:
+                        seen[gu][no] = it
+                done += 1
+                if done % 100 == 0:
+                    print(f"  {done} tiles", flush=True)
+
+    unique = sum(len(v) for v in seen.values())
+    print(f"\narticles: {raw_count:,} fetched, {unique:,} unique ({raw_count - unique:,} duplicates)")
+    if splits:
+        print(f"  {splits} tiles hit MAX_PAGES={MAX_PAGES} and were split")
+    if failed:
+        print(f"  warn: {sum(failed.values())} tiles failed: {failed}")
+    return seen, failed
+
+def summarize(seen):
+    districts, summary = {}, {"total_articles": 0, "total_sale": 0, "total_lease": 0, "total_rent": 0}
+    for gu, (code, lat, lng, _) in DISTRICTS.items():
+        items = list(seen[gu].values())
+        counts = {"sale": 0, "lease": 0, "rent": 0}
+        for it in items:
+            kind = trade_kind(it)
+            if kind:
+                counts[kind] += 1
+        # 확인일자 최근 순으로 샘플
+        sample = sorted(items, key=lambda it: (it.get("cfmYmd") or "", str(it.get("atclNo"))), reverse=True)[:SAMPLE]
+        districts[gu] = {
+            "lat": lat, "lng": lng,
+            "total": len(items), "count": len(items), "sample_count": len(sample),
+            "sale": counts["sale"], "lease": counts["lease"], "rent": counts["rent"],
+            "articles": [simplify(it) for it in sample],
+        }
+        summary["total_articles"] += len(items)
+        summary["total_sale"] += counts["sale"]
+        summary["total_lease"] += counts["lease"]
+        summary["total_rent"] += counts["rent"]
+        print(f"  {gu}: {len(items):,} (매매 {counts['sale']:,} / 전세 {counts['lease']:,} / 월세 {counts['rent']:,})")
+    return districts, summary
+
+def main():
+    ap = argparse.ArgumentParser(description="네이버 부동산 구별 매물 수집")
+    ap.add_argument("--base-url", default=BASE_URL, help="articleList 서버 (픽스처 테스트용)")
+    ap.add_argument("--out", default=os.path.join(REPO_DIR, OUT_FILE))
+    ap.add_argument("--workers", type=int, default=WORKERS)
+    ap.add_argument("--rate", type=float, default=RATE, help="초당 요청 수")
+    ap.add_argument("--no-push", action="store_true")
+    args = ap.parse_args()
+
+    now = datetime.now()
+    t0 = time.time()
+    seen, failed = crawl(args.base_url, args.workers, args.rate)
+    districts, summary = summarize(seen)
+    print(f"\nsweep: {time.time() - t0:.0f}s")
+
+    # 타일이 하나라도 빠지면 해당 구 건수가 적게 잡히므로 이전 파일 유지
+    if failed:
+        print(f"{sum(failed.values())} tiles failed ({', '.join(failed)}) - keep previous file")
+        sys.exit(1)
+
+    if not summary["total_articles"]:
+        print("No articles - keep previous file")
+        return
+
+    result = {
+        "updated_at": now.isoformat(),
+        "updated_display": now.strftime("%Y년 %m월 %d일 %H:%M"),
+        "districts": districts,
+        "summary": summary,
+    }
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"Saved: {args.out}")
+    if args.no_push:
+        return
+
+    print("\nGit push...")
+    os.chdir(REPO_DIR)
+    subprocess.run(["git", "pull", "origin", "master", "--rebase"], check=True)
+    subprocess.run(["git", "add", OUT_FILE, "scripts/collect-naver-listings.py"], check=True)
+    rc = subprocess.run(["git", "diff", "--cached", "--quiet"])
+    if rc.returncode != 0:
+        subprocess.run(["git", "commit", "-m", f"네이버 매물 데이터 ({now.strftime('%Y-%m-%d')})"], check=True)
+        subprocess.run(["git", "push", "origin", "master"], check=True)
+        print("Done!")
+    else:
+        print("No changes")
+
+if __name__ == "__main__":
+    main()
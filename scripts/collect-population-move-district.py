@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""KOSIS OpenAPI - 서울 구별 월별 총전입/총전출/순이동 수집 (병렬 조회)"""
+
+import json, re, os, subprocess, sys, time, urllib.request, urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from delta_feed import emit_delta
+
+KOSIS_KEY = "MzRkMGRlMGQ0MzhjOGMyOGE0YTc2NDdmMTdmZTA1MTQ="
+BASE_URL = "https://kosis.kr/openapi/Param/statisticsParameterData.do"
+REPO_DIR = os.path.expanduser("~/realestate-valley")
+
+OUT_FILE = "public/data/population-move-district.json"
+# 예전 수동 생성본 (언더스코어) - 대시 파일 하나로 통일
+LEGACY_FILE = "public/data/population_move_district.json"
+
+# DT_1B26003 행정구역 코드 (objL1=전출지, objL2=전입지, 00=전국)
+DISTRICTS = {
+    "종로구": "11010", "중구": "11020", "용산구": "11030",
+    "성동구": "11040", "광진구": "11050", "동대문구": "11060",
+    "중랑구": "11070", "성북구": "11080", "강북구": "11090",
+    "도봉구": "11100", "노원구": "11110", "은평구": "11120",
+    "서대문구": "11130", "마포구": "11140", "양천구": "11150",
+    "강서구": "11160", "구로구": "11170", "금천구": "11180",
+    "영등포구": "11190", "동작구": "11200", "관악구": "11210",
+    "서초구": "11220", "강남구": "11230", "송파구": "11240",
+    "강동구": "11250",
+}
+
+def parse_kosis(raw):
+    try:
+        return json.loads(raw)
+    except:
+        normalized = re.sub(r'([\{,]\s*)([A-Za-z_][A-Za-z0-9_]*)\s*:', r'\1"\2":', raw)
+        return json.loads(normalized)
+
+def fetch(obj_l1, obj_l2, start, end, retries=3):
+    params = {
+        "method": "getList", "apiKey": KOSIS_KEY,
+        "itmId": "T70 ", "objL1": obj_l1, "objL2": obj_l2,
+        "objL3": "0", "objL4": "000",
+        "objL5": "", "objL6": "", "objL7": "", "objL8": "",
+        "format": "json", "jsonVD": "Y", "prdSe": "M",
+        "startPrdDe": start, "endPrdDe": end,
+        "orgId": "101", "tblId": "DT_1B26003",
+    }
+    url = BASE_URL + "?" + urllib.parse.urlencode(params)
+    for attempt in range(retries):
+        try:
+            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+            with urllib.request.urlopen(req, timeout=15) as r:
+                raw = r.read().decode("utf-8")
+            data = parse_kosis(raw)
+            if isinstance(data, list): return data
+            if isinstance(data, dict) and "err" in data:
+                print(f"  warn: {obj_l1}->{obj_l2} {data}")
+            return None
+        except Exception as e:
+            if attempt < retries - 1:
+                time.sleep(1)
+            else:
+                print(f"  fail: {obj_l1}->{obj_l2} {e}")
+                return None
+
+def to_monthly(rows):
+    out = {}
+    for r in rows:
+        m, v = r.get("PRD_DE",""), r.get("DT","")
+        if m and v: out[m] = int(v)
+    return out
+
+def fetch_all(start, end):
+    """구별 전입(00->구)/전출(구->00) 쿼리를 한꺼번에 던지고
+    ((gu, kind) -> {month: value}, 실패한 (gu, kind) 목록)"""
+    jobs = {}
+    for name, code in DISTRICTS.items():
+        jobs[(name, "총전입")] = ("00", code)
+        jobs[(name, "총전출")] = (code, "00")
+    # 구 25개 x 전입/전출 = 50건을 한 번에 전부 띄워서 가장 느린 요청 하나 시간에 끝나도록
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {key: pool.submit(fetch, l1, l2, start, end) for key, (l1, l2) in jobs.items()}
+        results = {key: f.result() for key, f in futures.items()}
+    series = {key: to_monthly(rows) for key, rows in results.items() if rows is not None}
+    failed = [key for key, rows in results.items() if rows is None]
+    return series, failed
+
+def load_previous(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("data", {})
+    except (ValueError, OSError):
+        return {}
+
+def main():
+    now = datetime.now()
+    start, end = "202401", now.strftime("%Y%m")
+    print(f"KOSIS population move by district ({len(DISTRICTS)}구 x 2 queries in parallel)\n")
+
+    t0 = time.time()
+    series, failed = fetch_all(start, end)
+    print(f"fetched in {time.time()-t0:.1f}s\n")
+
+    out_path = os.path.join(REPO_DIR, OUT_FILE)
+    previous = load_previous(out_path)
+    failed_gu = {name for name, _ in failed}
+    missing = sorted(failed_gu - set(previous), key=list(DISTRICTS).index)
+    if missing:
+        # 이전 블록도 없는 구를 0 이나 누락으로 내보내지 않는다
+        print(f"\nQuery failed with no previous data: {', '.join(missing)} - keep previous file")
+        sys.exit(1)
+
+    result = {"updated": now.strftime("%Y-%m-%d"), "data": {}}
+    for name in DISTRICTS:
+        if name in failed_gu:
+            result["data"][name] = previous[name]
+            print(f"  {name}: query failed - keep previous {len(previous[name])} months")
+            continue
+        im, om = series[(name, "총전입")], series[(name, "총전출")]
+        # 전입/전출 둘 다 있는 달만 - 한쪽이 빠진 달을 0 으로 채우면 순이동이 틀어진다
+        months = sorted(set(im) & set(om))
+        if not months:
+            if name not in previous:
+                print(f"\n{name}: no data and no previous block - keep previous file")
+                sys.exit(1)
+            result["data"][name] = previous[name]
+            print(f"  {name}: no data - keep previous {len(previous[name])} months")
+            continue
+        result["data"][name] = {
+            m: {"총전입": im[m], "총전출": om[m], "순이동": im[m] - om[m]}
+            for m in months
+        }
+        last = months[-1]
+        print(f"  {name}: {len(months)} months, {last[:4]}.{last[4:]} {result['data'][name][last]['순이동']:+,}")
+
+    if not result["data"]:
+        print("\nNo data - keep previous file")
+        return
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    emit_delta(out_path, result)
+    print(f"\nSaved: {out_path}")
+
+    print("\nGit push...")
+    os.chdir(REPO_DIR)
+    subprocess.run(["git","pull","origin","master","--rebase"], check=True)
+    if os.path.exists(LEGACY_FILE):
+        subprocess.run(["git","rm","-q","--ignore-unmatch",LEGACY_FILE], check=True)
+    subprocess.run(["git","add","public/data/deltas",OUT_FILE,"scripts/collect-population-move-district.py"], check=True)
+    rc = subprocess.run(["git","diff","--cached","--quiet"])
+    if rc.returncode != 0:
+        subprocess.run(["git","commit","-m",f"구별 인구이동 데이터 ({now.strftime('%Y-%m-%d')})"], check=True)
+        subprocess.run(["git","push","origin","master"], check=True)
+        print("Done!")
+    else:
+        print("No changes")
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 
 import json, time, urllib.request, subprocess, os
 from datetime import datetime
+from delta_feed import emit_delta
 
 RONE_KEY = "6a38db12e18a447f9f822a510b3a8616"
 RONE_URL = "https://www.reb.or.kr/r-one/openapi/SttsApiTblData.do"
@@ -94,6 +95,7 @@ def main():
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
+    emit_delta(out_path, result)
 
     print(f"\n🎉 수집 완료!")
     print(f"📁 저장: {out_path}")
@@ -101,7 +103,7 @@ def main():
     # Git push
     print("\n📤 Git push 중...")
     os.chdir(REPO_DIR)
-    subprocess.run(["git", "add", "public/data/price-index.json"], check=True)
+    subprocess.run(["git", "add", "public/data/deltas", "public/data/price-index.json"], check=True)
     rc = subprocess.run(["git", "diff", "--cached", "--quiet"])
     if rc.returncode != 0:
         subprocess.run(["git", "commit", "-m", f"가격지수 자동 갱신 ({now.strftime('%Y-%m-%d')})"], check=True)
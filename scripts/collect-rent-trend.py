@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """전월세 실거래가 수집 - Vercel API 경유"""
 
-import json, os, subprocess, time, xml.etree.ElementTree as ET
+import json, os, re, subprocess, time
 from datetime import datetime
+from delta_feed import emit_delta
+from xml_pool import ParserPool, RENT_RECORD, parse_rent_xml, unpack_rent
 from urllib.request import urlopen, Request
 
 VERCEL_URL = "https://realestate-valley.vercel.app/api/apt-rent"
@@ -18,35 +20,53 @@ DISTRICTS = {
     "강동구":"11740",
 }
 
-def fetch_rent(lawd_cd, deal_ymd, retries=3):
+RESULT_CODE_RE = re.compile(rb"<resultCode>\s*(\d+)\s*</resultCode>")
+
+def check_response(raw):
+    """api/apt-rent 는 data.go.kr 응답을 항상 200 으로 넘겨서 에러/잘린 본문도 여기까지 온다.
+    전체 파싱은 워커에서 하므로 여기선 결과코드와 닫는 태그만 본다."""
+    m = RESULT_CODE_RE.search(raw)
+    if not m:
+        raise ValueError(f"no resultCode: {raw[:120]!r}")
+    if m.group(1).strip(b"0"):
+        raise ValueError(f"resultCode {m.group(1).decode()}")
+    if not raw.rstrip().endswith(b"</response>"):
+        raise ValueError("truncated response")
+
+def fetch_rent_raw(lawd_cd, deal_ymd, retries=3):
+    """응답 원문 bytes - 파싱은 ParserPool 워커에서"""
     url = f"{VERCEL_URL}?LAWD_CD={lawd_cd}&DEAL_YMD={deal_ymd}&numOfRows=5000"
     for attempt in range(retries):
         try:
             req = Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            raw = urlopen(req, timeout=30).read().decode("utf-8")
-            root = ET.fromstring(raw)
-            items = root.findall(".//item")
-            results = []
-            for item in items:
-                deposit = item.findtext("deposit", "").strip().replace(",", "")
-                monthly = item.findtext("monthlyRent", "").strip().replace(",", "")
-                area = item.findtext("excluUseAr", "").strip()
-                if deposit and area:
-                    try:
-                        dep = int(deposit)
-                        mon = int(monthly) if monthly else 0
-                        ar = float(area)
-                        # 전세: 월세=0, 월세: 월세>0
-                        results.append({"deposit": dep, "monthly": mon, "area": ar, "type": "전세" if mon == 0 else "월세"})
-                    except:
-                        pass
-            return results
+            raw = urlopen(req, timeout=30).read()
+            check_response(raw)
+            return raw
         except Exception as e:
             if attempt < retries - 1:
                 time.sleep(2)
             else:
                 print(f"    fail: {e}")
-                return []
+                return None
+
+def summarize(ym, buf):
+    jeonse = [d for d, m, a in unpack_rent(buf) if m == 0]
+    total = len(buf) // RENT_RECORD.size
+    return {
+        "month": ym,
+        "jeonse_avg": int(sum(jeonse) / len(jeonse)) if jeonse else 0,
+        "jeonse_count": len(jeonse),
+        "wolse_count": total - len(jeonse),
+        "total": total,
+    }
+
+def load_previous(path):
+    """직전 rent-trend.json 의 (구, 월) -> 행. 이번에 못 받은 달은 이 값을 유지"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        prev = json.load(f)
+    return {(name, r["month"]): r for name, rows in prev.get("districts", {}).items() for r in rows}
 
 def main():
     now = datetime.now()
@@ -60,36 +80,61 @@ def main():
     print(f"전월세 실거래가 수집 ({len(months)}개월 x {len(DISTRICTS)}구)\n")
 
     result = {"updated": now.strftime("%Y-%m-%d %H:%M"), "months": months, "districts": {}}
+    out_path = os.path.join(REPO_DIR, "public/data/rent-trend.json")
+    previous = load_previous(out_path)
+    failed = []
 
-    for name, code in DISTRICTS.items():
-        print(f"{name}...", end=" ", flush=True)
-        monthly_data = []
-        for ym in months:
-            items = fetch_rent(code, ym)
-            jeonse = [x for x in items if x["type"] == "전세"]
-            avg_jeonse = int(sum(x["deposit"] for x in jeonse) / len(jeonse)) if jeonse else 0
-            monthly_data.append({
-                "month": ym,
-                "jeonse_avg": avg_jeonse,
-                "jeonse_count": len(jeonse),
-                "wolse_count": len([x for x in items if x["type"] == "월세"]),
-                "total": len(items),
-            })
-            time.sleep(0.3)
-        result["districts"][name] = monthly_data
-        cnt = sum(x["total"] for x in monthly_data)
-        print(f"{cnt}건")
+    # 받는 동안 이전 응답은 워커 프로세스에서 파싱
+    with ParserPool() as pool:
+        pending = {}
+        for name, code in DISTRICTS.items():
+            for ym in months:
+                raw = fetch_rent_raw(code, ym)
+                pending[(name, ym)] = pool.submit(raw) if raw else None
+                time.sleep(0.3)
+            print(f"{name} fetched", flush=True)
+
+        for name, code in DISTRICTS.items():
+            monthly_data = []
+            for ym in months:
+                fut = pending[(name, ym)]
+                buf = None
+                if fut:
+                    try:
+                        buf = fut.result()
+                    except Exception as e:
+                        # 워커에서 깨지면 한 번 더 받아서 여기서 직접 파싱
+                        print(f"    parse fail {name} {ym}: {e} - retry")
+                        raw = fetch_rent_raw(code, ym)
+                        try:
+                            buf = parse_rent_xml(raw) if raw else None
+                        except Exception as e:
+                            print(f"    parse fail {name} {ym}: {e}")
+                if buf is not None:
+                    monthly_data.append(summarize(ym, buf))
+                    continue
+                # 끝내 실패한 달은 0 으로 쓰지 않고 직전 값 유지, 없으면 None 자리표시
+                # (App.js 가 months 와 같은 위치로 읽으므로 행을 빼면 안 됨)
+                failed.append((name, ym))
+                monthly_data.append(previous.get((name, ym)) or
+                                    {"month": ym, "jeonse_avg": None, "jeonse_count": None, "wolse_count": None, "total": None})
+            result["districts"][name] = monthly_data
+            cnt = sum(x["total"] or 0 for x in monthly_data)
+            print(f"{name}: {cnt}건")
+
+    if failed:
+        print(f"\n  warn: {len(failed)}개 구-월 수집 실패 (직전 값 유지, 없으면 빈 행): {failed[:10]}")
 
-    out_path = os.path.join(REPO_DIR, "public/data/rent-trend.json")
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
+    emit_delta(out_path, result)
     print(f"\nSaved: {out_path}")
 
     print("\nGit push...")
     os.chdir(REPO_DIR)
     subprocess.run(["git", "pull", "origin", "master", "--rebase"], check=True)
-    subprocess.run(["git", "add", "public/data/rent-trend.json", "scripts/collect-rent-trend.py"], check=True)
+    subprocess.run(["git", "add", "public/data/deltas", "public/data/rent-trend.json", "scripts/collect-rent-trend.py"], check=True)
     rc = subprocess.run(["git", "diff", "--cached", "--quiet"])
     if rc.returncode != 0:
         subprocess.run(["git", "commit", "-m", f"전월세 데이터 ({now.strftime('%Y-%m-%d')})"], check=True)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """서울 권역별 월별 아파트 실거래가 + 거래량 수집 (Vercel API 경유)"""
 
-import json, time, urllib.request
+import json, os, time, urllib.request
 from datetime import datetime
+from delta_feed import emit_delta
+from dong_index import update_trades
 
 API_BASE = "https://realestate-valley.vercel.app/api/apt-trade"
 
@@ -116,6 +118,13 @@ def main():
     out_path = "public/data/trade-trend.json"
     with open(out_path, "w", encoding="utf-8") as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
+    emit_delta(out_path, result)
+
+    # 법정동 역색인 (dong/jibun 은 원본 거래에만 있음)
+    update_trades(
+        {gu: [i for ym in months for i in district_monthly[gu].get(ym, [])] for gu in DISTRICTS},
+        data_dir=os.path.dirname(out_path),
+    )
 
     total_trades = sum(
         sum(len(district_monthly[gu].get(ym, [])) for ym in months)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""수집 결과 델타 피드 - 바뀐 (series, month, value) 만 버전별로 기록
+
+collect-*.py 가 전체 JSON 을 저장한 뒤 emit_delta(out_path, result) 를 호출하면
+public/data/deltas/<dataset>/ 아래에 다음을 남긴다.
+
+  latest.json    {"dataset", "version", "snapshot", "updated"}  - 클라이언트가 먼저 읽는 포인터
+  snapshot.json  {"dataset", "version", "series": {series: {month: value}}}
+  v<N>.json      {"dataset", "version", "base", "updated", "changes": [[series, month, value], ...]}
+
+버전 N 을 가진 클라이언트: latest.json 확인 -> N >= snapshot 이면 v<N+1>..v<latest> 만 받아 적용,
+아니면 snapshot.json 부터 다시. 삭제된 값은 value=null.
+
+오래된 델타는 compact() 로 snapshot 에 합친다 (python delta_feed.py compact [--keep N]).
+"""
+
+import json, os, re, sys
+from datetime import datetime
+
+REPO_DIR = os.path.expanduser("~/realestate-valley")
+MONTH_RE = re.compile(r"^\d{6}$")
+SKIP_KEYS = {"updated", "period", "months"}
+# 경로에서 빼도 되는 감싸기용 키 - series 이름을 짧게 유지
+WRAPPER_KEYS = {"data", "monthly", "districts"}
+KEEP_DELTAS = 24       # compact 후에도 남겨둘 최근 델타 수
+AUTO_COMPACT = 60      # 델타가 이만큼 쌓이면 emit 시 자동 compact
+
+def flatten(obj, path=()):
+    """수집 JSON -> {series: {month: value}}
+
+    - {"YYYYMM": 값 | {필드: 값}} 형태의 dict
+    - [{"month": ..., 필드: 값}, ...] 형태의 list
+    두 모양만 시계열로 보고 나머지는 키를 따라 내려간다.
+    """
+    out = {}
+
+    def put(series, month, value):
+        if isinstance(value, (int, float, str)) or value is None:
+            out.setdefault(series, {})[month] = value
+
+    def walk(node, path):
+        key = "/".join(p for p in path if p not in WRAPPER_KEYS)
+        if isinstance(node, dict):
+            if node and all(MONTH_RE.match(str(k)) for k in node):
+                for m, v in node.items():
+                    if isinstance(v, dict):
+                        for field, fv in v.items():
+                            put(f"{key}/{field}", m, fv)
+                    else:
+                        put(key, m, v)
+                return
+            for k, v in node.items():
+                if not path and k in SKIP_KEYS:
+                    continue
+                walk(v, path + (str(k),))
+        elif isinstance(node, list):
+            for row in node:
+                if not isinstance(row, dict) or "month" not in row:
+                    continue
+                for field, v in row.items():
+                    if field == "month":
+                        continue
+                    put(f"{key}/{field}" if len(row) > 2 else key, row["month"], v)
+
+    walk(obj, path)
+    return out
+
+def _read(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def _write(path, obj):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+def _delta_path(feed_dir, version):
+    return os.path.join(feed_dir, f"v{version}.json")
+
+def materialize(feed_dir):
+    """snapshot + 이후 델타 적용 -> (version, series)"""
+    latest = _read(os.path.join(feed_dir, "latest.json"))
+    snap = _read(os.path.join(feed_dir, "snapshot.json"))
+    if not latest or not snap:
+        return 0, {}
+    series = snap["series"]
+    for v in range(snap["version"] + 1, latest["version"] + 1):
+        delta = _read(_delta_path(feed_dir, v))
+        if delta is None:
+            raise RuntimeError(f"missing delta {feed_dir} v{v}")
+        apply_changes(series, delta["changes"])
+    return latest["version"], series
+
+def apply_changes(series, changes):
+    for s, m, v in changes:
+        if v is None:
+            series.get(s, {}).pop(m, None)
+            if s in series and not series[s]:
+                del series[s]
+        else:
+            series.setdefault(s, {})[m] = v
+    return series
+
+def diff(old, new):
+    changes = []
+    for s in sorted(set(old) | set(new)):
+        o, n = old.get(s, {}), new.get(s, {})
+        for m in sorted(set(o) | set(n)):
+            if m not in n:
+                changes.append([s, m, None])
+            elif o.get(m) != n[m] or m not in o:
+                changes.append([s, m, n[m]])
+    return changes
+
+def emit_delta(out_path, result):
+    """out_path 에 저장한 result 와 직전 버전을 비교해 델타 기록. 새 버전 번호(변경 없으면 None) 반환"""
+    dataset = os.path.splitext(os.path.basename(out_path))[0]
+    feed_dir = os.path.join(os.path.dirname(out_path), "deltas", dataset)
+    os.makedirs(feed_dir, exist_ok=True)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    new = flatten(result)
+
+    version, old = materialize(feed_dir)
+    if version == 0:
+        _write(os.path.join(feed_dir, "snapshot.json"), {"dataset": dataset, "version": 1, "series": new})
+        _write(os.path.join(feed_dir, "latest.json"), {"dataset": dataset, "version": 1, "snapshot": 1, "updated": now})
+        print(f"  delta: {dataset} snapshot v1 ({len(new)} series)")
+        return 1
+
+    changes = diff(old, new)
+    if not changes:
+        print(f"  delta: {dataset} v{version} unchanged")
+        return None
+
+    version += 1
+    _write(_delta_path(feed_dir, version), {
+        "dataset": dataset, "version": version, "base": version - 1, "updated": now, "changes": changes,
+    })
+    latest = _read(os.path.join(feed_dir, "latest.json"))
+    latest.update({"version": version, "updated": now})
+    _write(os.path.join(feed_dir, "latest.json"), latest)
+    print(f"  delta: {dataset} v{version} ({len(changes)} changes, {os.path.getsize(_delta_path(feed_dir, version)):,} bytes)")
+
+    if version - latest["snapshot"] >= AUTO_COMPACT:
+        compact(feed_dir)
+    return version
+
+def compact(feed_dir, keep=KEEP_DELTAS):
+    """최근 keep 개만 남기고 그 이전 델타를 snapshot 에 합친다"""
+    latest = _read(os.path.join(feed_dir, "latest.json"))
+    snap = _read(os.path.join(feed_dir, "snapshot.json"))
+    if not latest or not snap:
+        return
+    target = latest["version"] - keep
+    if target <= snap["version"]:
+        return
+    series = snap["series"]
+    for v in range(snap["version"] + 1, target + 1):
+        apply_changes(series, _read(_delta_path(feed_dir, v))["changes"])
+    # snapshot 을 먼저 바꾼 뒤 포인터 갱신, 마지막에 델타 삭제
+    _write(os.path.join(feed_dir, "snapshot.json"), {"dataset": snap["dataset"], "version": target, "series": series})
+    latest["snapshot"] = target
+    _write(os.path.join(feed_dir, "latest.json"), latest)
+    for v in range(snap["version"] + 1, target + 1):
+        os.remove(_delta_path(feed_dir, v))
+    print(f"  compact: {snap['dataset']} snapshot v{snap['version']} -> v{target}")
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] != "compact":
+        print("usage: delta_feed.py compact [--keep N]")
+        sys.exit(1)
+    keep = KEEP_DELTAS
+    if "--keep" in sys.argv:
+        keep = int(sys.argv[sys.argv.index("--keep") + 1])
+    root = os.path.join(REPO_DIR, "public/data/deltas")
+    if not os.path.isdir(root):
+        print(f"no feeds: {root}")
+        return
+    for name in sorted(os.listdir(root)):
+        feed_dir = os.path.join(root, name)
+        if os.path.isdir(feed_dir):
+            compact(feed_dir, keep)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""법정동 역색인 - 학교 / 정비사업 / 실거래를 (구, 법정동, 지번) 키로 묶기
+
+public/data/index/ 아래 소스별 파일 하나씩:
+
+  schools.json   {gu: {dong: {jibun: [[idx, name, type], ...]}}}        school-info.json
+  projects.json  {gu: {dong: {jibun: [[idx, name, type, stage], ...]}}}  cleanup-status.json
+  trades.json    {gu: {dong: {jibun: [apt, count, avg, last_month]}}}    collect-trade-trend.py 가 호출
+
+idx 는 원본 파일 배열의 위치. 지번을 모르는 항목(도로명 주소 학교 등)은 jibun="" 아래에 둔다.
+"OO동 재건축 조합설립인가 구역 주변 거래" 같은 조인은 projects 에서 (구, 동) 을 뽑아
+trades[구][동] 을 바로 찾으면 된다.
+
+소스별 입력 해시를 index/_meta.json 에 남겨서 바뀐 소스만 다시 만든다.
+
+  python dong_index.py [schools|projects ...] [--force]
+"""
+
+import json, os, re, sys, hashlib
+from datetime import datetime
+
+REPO_DIR = os.path.expanduser("~/realestate-valley")
+DATA_DIR = os.path.join(REPO_DIR, "public/data")
+
+DONG_RE = re.compile(r"^[가-힣]+\d*(?:동|가|로)(?:\d+가)?$")
+ADDR_RE = re.compile(r"^\s*([가-힣0-9]+?(?:동|가|로)\d*가?)(?=\s|$)(?:\s+(산\s*)?(\d+)(?:-(\d+))?)?")
+HADONG_RE = re.compile(r"^([가-힣]+?)\d+(?:[.·]\d+)*동$")
+
+def norm_dong(dong):
+    """공백 제거, 행정동 번호(상계10동) -> 법정동(상계동)"""
+    dong = re.sub(r"\s+", "", dong or "")
+    m = HADONG_RE.match(dong)
+    if m and not m.group(1).endswith("가"):
+        return m.group(1) + "동"
+    return dong
+
+def norm_jibun(jibun):
+    """'0138-0001' / '138-1' / '산 12' -> '138-1' / '산12'. 모르면 ''"""
+    jibun = re.sub(r"\s+", "", jibun or "")
+    m = re.match(r"^(산)?0*(\d+)(?:-0*(\d+))?", jibun)
+    if not m:
+        return ""
+    main, sub = m.group(2) or "0", m.group(3)
+    key = (m.group(1) or "") + main
+    return f"{key}-{sub}" if sub and sub != "0" else key
+
+def parse_lot_address(addr):
+    """'개포동 138' / '영등포동5가 81-1' / '신림동 산 12 일대' -> (dong, jibun)"""
+    m = ADDR_RE.match(addr or "")
+    if not m:
+        return "", ""
+    dong = norm_dong(m.group(1))
+    if not m.group(3):
+        return dong, ""
+    jibun = ("산" if m.group(2) else "") + m.group(3) + (f"-{m.group(4)}" if m.group(4) else "")
+    return dong, norm_jibun(jibun)
+
+def school_dong(school):
+    """도로명 주소 뒤 참고항목 '(충정로2가/경기초등학교)', '/ 학교명 (석촌동)' 에서 법정동"""
+    detail = school.get("address_detail") or ""
+    for group in list(reversed(re.findall(r"\(([^)]*)\)", detail))) + [detail]:
+        for token in re.split(r"[/,()\s]+", group):
+            token = re.sub(r"(?<=[동가로])[\d-]+$", "", token)
+            if DONG_RE.match(token):
+                return norm_dong(token)
+    return ""
+
+def _add(index, gu, dong, jibun, entry):
+    index.setdefault(gu, {}).setdefault(dong, {}).setdefault(jibun, []).append(entry)
+
+# ── 소스별 빌더: raw -> (index, 매칭 못한 건수) ──
+
+def build_schools(raw):
+    index, missed = {}, 0
+    for i, s in enumerate(raw["schools"]):
+        dong = school_dong(s)
+        if not dong:
+            missed += 1
+        _add(index, s["district"], dong, "", [i, s["name"], s["type"]])
+    return index, missed
+
+def build_projects(raw):
+    index, missed = {}, 0
+    for i, p in enumerate(raw["items"]):
+        dong, jibun = parse_lot_address(p["address"])
+        if not dong:
+            missed += 1
+        _add(index, p["district"], dong, jibun, [i, p["name"], p["type"], p["stage"]])
+    return index, missed
+
+def build_trades(items_by_gu):
+    """{gu: [api/apt-trade item, ...]} -> {gu: {dong: {jibun: [apt, count, avg, last_month]}}}
+
+    count 는 전체 거래 수, avg 는 가격이 있는 (> 0) 거래만의 평균 - collect-trade-trend 와 같은 기준
+    """
+    acc, priced, missed = {}, {}, 0    # priced: (gu, dong, jibun) -> 가격 있는 거래 수
+    for gu, items in items_by_gu.items():
+        for it in items:
+            dong = norm_dong(it.get("dong", ""))
+            if not dong:
+                missed += 1
+            jibun = norm_jibun(it.get("jibun", ""))
+            try:
+                price = int(str(it.get("price", "0")).replace(",", "").strip() or 0)
+            except ValueError:
+                price = 0
+            ym = f"{it.get('year', '')}{str(it.get('month', '')).zfill(2)}"
+            cell = acc.setdefault(gu, {}).setdefault(dong, {}).setdefault(jibun, [it.get("aptName", ""), 0, 0, ""])
+            cell[1] += 1
+            if price > 0:
+                cell[2] += price
+                priced[gu, dong, jibun] = priced.get((gu, dong, jibun), 0) + 1
+            cell[3] = max(cell[3], ym)
+    for gu, dongs in acc.items():
+        for dong, jibuns in dongs.items():
+            for jibun, cell in jibuns.items():
+                n = priced.get((gu, dong, jibun), 0)
+                cell[2] = round(cell[2] / n) if n else 0
+    return acc, missed
+
+SOURCES = {
+    "schools": ("school-info.json", build_schools),
+    "projects": ("cleanup-status.json", build_projects),
+}
+
+# ── 쓰기 / 증분 ──
+
+def _digest(obj):
+    return hashlib.md5(json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+def _meta_path(data_dir):
+    return os.path.join(data_dir, "index", "_meta.json")
+
+def _load_meta(data_dir):
+    path = _meta_path(data_dir)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def _write_index(data_dir, name, source, index, digest, missed, force=False):
+    meta = _load_meta(data_dir)
+    out_path = os.path.join(data_dir, "index", f"{name}.json")
+    if not force and meta.get(name, {}).get("digest") == digest and os.path.exists(out_path):
+        print(f"  {name}: unchanged")
+        return None
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"updated": now, "source": source, "data": index}, f, ensure_ascii=False, separators=(",", ":"))
+    dongs = sum(len(d) for d in index.values())
+    meta[name] = {"digest": digest, "updated": now, "dongs": dongs, "unmatched": missed}
+    with open(_meta_path(data_dir), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1, sort_keys=True)
+    print(f"  {name}: {dongs}개 동, 미매칭 {missed}건 -> {os.path.getsize(out_path):,} bytes")
+    return out_path
+
+def update_source(name, data_dir=DATA_DIR, force=False):
+    source, builder = SOURCES[name]
+    with open(os.path.join(data_dir, source), encoding="utf-8") as f:
+        raw = json.load(f)
+    index, missed = builder(raw)
+    return _write_index(data_dir, name, source, index, _digest(raw), missed, force)
+
+def update_trades(items_by_gu, data_dir=DATA_DIR, force=False):
+    """collect-trade-trend.py 에서 수집한 원본 거래로 trades.json 갱신"""
+    index, missed = build_trades(items_by_gu)
+    return _write_index(data_dir, "trades", "api/apt-trade", index, _digest(index), missed, force)
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    force = "--force" in sys.argv
+    names = args or list(SOURCES)
+    for name in names:
+        if name not in SOURCES:
+            print(f"unknown source: {name} (trades 는 collect-trade-trend.py 에서 갱신)")
+            sys.exit(1)
+    print(f"dong index: {', '.join(names)}")
+    for name in names:
+        update_source(name, force=force)
+
+if __name__ == "__main__":
+    main()
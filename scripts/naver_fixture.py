@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""collect-naver-listings.py 테스트용 로컬 articleList 서버
+
+구 경계 박스 안에 STEP° 간격 격자로 가짜 매물을 깔아두고, 요청 박스(btm/lft/top/rgt)와
+cortarNo 에 맞는 매물을 20건씩 페이지로 돌려준다. 매물번호는 좌표로 고정이라
+겹치는 타일에서 같은 매물이 다시 나오고, 구별 기대 건수는 expected() 로 알 수 있다.
+DENSE 박스에는 타일 하나에 페이지 상한(600건)을 넘는 매물을 몰아 둬서 타일 4등분 경로를 탄다.
+
+  python naver_fixture.py 8765
+  python collect-naver-listings.py --base-url http://127.0.0.1:8765 --out /tmp/n.json --no-push --rate 200
+"""
+
+import importlib.util, json, os, sys, urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STEP = 0.002
+PAGE_SIZE = 20
+TRADES = [("A1", "매매"), ("B1", "전세"), ("B2", "월세")]
+# 구 코드 -> 매물 밀집 박스 (btm, lft, top, rgt), DENSE_STEP 간격 (0.006° 박스에 30 x 30 = 900건)
+DENSE = {"11680": (37.5005, 127.0505, 37.5065, 127.0565)}
+DENSE_STEP = 0.0002
+
+def _districts():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "collect-naver-listings.py")
+    spec = importlib.util.spec_from_file_location("collect_naver_listings", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod.DISTRICTS
+
+DISTRICTS = _districts()
+
+def _lattice(prefix, box, step):
+    btm, lft, top, rgt = box
+    out = []
+    i = 0
+    while btm + i * step < top:
+        j = 0
+        while lft + j * step < rgt:
+            no = f"{prefix}{i:03d}{j:03d}"
+            out.append((no, round(btm + i * step, 6), round(lft + j * step, 6), (i + j) % 3))
+            j += 1
+        i += 1
+    return out
+
+def _grid(cortar_no):
+    """해당 구 박스 안 격자 매물 (+ 밀집 박스) [(atclNo, lat, lng, trade_idx)]"""
+    for code, _, _, bbox in DISTRICTS.values():
+        if code + "00000" != cortar_no:
+            continue
+        out = _lattice(code, bbox, STEP)
+        if code in DENSE:
+            out += _lattice(code + "9", DENSE[code], DENSE_STEP)
+        return out
+    return []
+
+_GRIDS = {code + "00000": _grid(code + "00000") for code, _, _, _ in DISTRICTS.values()}
+
+def expected():
+    """{gu: {"total", "sale", "lease", "rent"}}"""
+    out = {}
+    for gu, (code, _, _, _) in DISTRICTS.items():
+        grid = _GRIDS[code + "00000"]
+        out[gu] = {"total": len(grid), "sale": 0, "lease": 0, "rent": 0}
+        for *_, t in grid:
+            out[gu][("sale", "lease", "rent")[t]] += 1
+    return out
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        if url.path != "/cluster/ajax/articleList":
+            self.send_error(404)
+            return
+        q = {k: v[0] for k, v in urllib.parse.parse_qs(url.query, keep_blank_values=True).items()}
+        btm, lft, top, rgt = (float(q[k]) for k in ("btm", "lft", "top", "rgt"))
+        page = int(q.get("page", "1"))
+        hits = [a for a in _GRIDS.get(q.get("cortarNo", ""), []) if btm <= a[1] < top and lft <= a[2] < rgt]
+        chunk = hits[(page - 1) * PAGE_SIZE: page * PAGE_SIZE]
+        body = [{
+            "atclNo": no, "atclNm": f"픽스처아파트{no[-3:]}", "cpNm": "", "rletTpNm": "아파트",
+            "tradTpCd": TRADES[t][0], "tradTpNm": TRADES[t][1], "hanPrc": "10억 5,000", "rentPrc": 0,
+            "spc1": "112", "spc2": "84.97", "flrInfo": "10/20", "direction": "남향",
+            "atclFetrDesc": "", "tagList": [], "lat": lat, "lng": lng, "cfmYmd": "26.04.12",
+        } for no, lat, lng, t in chunk]
+        payload = json.dumps({"code": "success", "page": page, "more": page * PAGE_SIZE < len(hits), "body": body},
+                             ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    total = sum(e["total"] for e in expected().values())
+    print(f"fixture: http://127.0.0.1:{port}  ({total:,} articles)")
+    ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""public/data/*.json 읽기 전용 접근 API (노트북/배치용)
+
+    import rvdata
+    rvdata.trade_trend().get("강남구", "202501", "avg")
+    rvdata.rent_trend().series("마포구", "jeonse_avg")
+    rvdata.schools().by_district("노원구")
+
+파일은 처음 접근할 때 읽고, mtime 이 바뀌기 전까지 프로세스 안 LRU 캐시에 둔다.
+json 등 무거운 모듈은 첫 로드 때 import - `import rvdata` 자체는 가볍게 유지.
+데이터 위치는 RV_DATA_DIR 환경변수로 바꿀 수 있다 (기본: 저장소 public/data).
+"""
+
+_DATASETS = ("trade_trend", "rent_trend", "price_index", "unsold", "schools", "cleanup")
+_CACHE = ("cache_info", "cache_clear", "data_dir")
+
+__all__ = list(_DATASETS + _CACHE)
+
+def __getattr__(name):
+    if name in _DATASETS:
+        from . import datasets
+        return getattr(datasets, name)
+    if name in _CACHE:
+        from . import _cache
+        return getattr(_cache, name)
+    raise AttributeError(f"module 'rvdata' has no attribute {name!r}")
+
+def __dir__():
+    return __all__
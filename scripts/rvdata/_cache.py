@@ -0,0 +1,43 @@
+"""mtime 기반 무효화 + LRU 캐시"""
+
+import os
+from collections import OrderedDict
+
+MAXSIZE = 16
+
+_entries = OrderedDict()    # (name, builder) -> (mtime_ns, size, value)
+_stats = {"hits": 0, "misses": 0}
+
+def data_dir():
+    env = os.environ.get("RV_DATA_DIR")
+    if env:
+        return env
+    return os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "public", "data"))
+
+def load(name, builder):
+    """public/data/<name> 을 builder(raw_json) 로 변환한 값 - 파일이 그대로면 캐시 재사용"""
+    path = os.path.join(data_dir(), name)
+    st = os.stat(path)
+    key = (path, builder)
+    hit = _entries.get(key)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        return hit[2]
+
+    import json
+    _stats["misses"] += 1
+    with open(path, encoding="utf-8") as f:
+        value = builder(json.load(f))
+    _entries[key] = (st.st_mtime_ns, st.st_size, value)
+    _entries.move_to_end(key)
+    while len(_entries) > MAXSIZE:
+        _entries.popitem(last=False)
+    return value
+
+def cache_info():
+    return {"hits": _stats["hits"], "misses": _stats["misses"], "size": len(_entries), "maxsize": MAXSIZE}
+
+def cache_clear():
+    _entries.clear()
+    _stats["hits"] = _stats["misses"] = 0
@@ -0,0 +1,74 @@
+"""데이터셋별 로더 - 각 함수는 캐시된 MonthlyPanel / Table 을 돌려준다"""
+
+from ._cache import load
+from .frames import MonthlyPanel, Table
+
+def _trade_trend(raw):
+    p = MonthlyPanel(raw["months"], ("avg", "count", "median", "max", "min"))
+    for gu, d in raw["districts"].items():
+        for r in d["monthly"]:
+            p.put(gu, "avg", r["month"], r["avg"] or None)
+            p.put(gu, "count", r["month"], r["count"])
+    for zone, d in raw["zones"].items():
+        for r in d["monthly"]:
+            for f in p.fields:
+                v = r.get(f)
+                p.put(zone, f, r["month"], (v or None) if f != "count" else v)
+    return p
+
+def _rent_trend(raw):
+    p = MonthlyPanel(raw["months"], ("jeonse_avg", "jeonse_count", "wolse_count", "total"))
+    for gu, rows in raw["districts"].items():
+        for r in rows:
+            p.put(gu, "jeonse_avg", r["month"], r["jeonse_avg"] or None)
+            for f in p.fields[1:]:
+                p.put(gu, f, r["month"], r[f])
+    return p
+
+def _price_index(raw):
+    p = MonthlyPanel(raw["months"], ("매매지수", "전세지수"))
+    for f in p.fields:
+        for region, rows in raw[f].items():
+            for r in rows:
+                p.put(region, f, r["month"], r["value"])
+    return p
+
+def _unsold(raw):
+    months = {m for d in raw["data"].values() for m in d}
+    p = MonthlyPanel(months, ("unsold",))
+    for gu, d in raw["data"].items():
+        for m, v in d.items():
+            p.put(gu, "unsold", m, v)
+    return p
+
+def _schools(raw):
+    rows = raw["schools"]
+    return Table(rows, ("name", "type", "district", "address", "public", "coed", "founded", "code"))
+
+def _cleanup(raw):
+    rows = raw["items"]
+    return Table(rows, ("no", "district", "type", "name", "address", "stage", "op_type", "op_stage"))
+
+def trade_trend():
+    """구/권역 x 월 매매 평균가(만원)·거래량 - trade-trend.json"""
+    return load("trade-trend.json", _trade_trend)
+
+def rent_trend():
+    """구 x 월 전세 평균 보증금·전월세 건수 - rent-trend.json"""
+    return load("rent-trend.json", _rent_trend)
+
+def price_index():
+    """서울/권역 x 월 매매·전세 가격지수 - price-index.json"""
+    return load("price-index.json", _price_index)
+
+def unsold():
+    """구 x 월 미분양 호수 - unsold-district.json"""
+    return load("unsold-district.json", _unsold)
+
+def schools():
+    """초/중/고 학교 목록 - school-info.json"""
+    return load("school-info.json", _schools)
+
+def cleanup():
+    """정비사업(재개발/재건축) 추진 현황 - cleanup-status.json"""
+    return load("cleanup-status.json", _cleanup)
@@ -0,0 +1,96 @@
+"""컬럼 기반 인메모리 형태 - 월별 패널 / 레코드 테이블"""
+
+from array import array
+from math import isnan
+
+NAN = float("nan")
+
+class MonthlyPanel:
+    """(키, 필드) -> 월 인덱스 float 배열. 키는 구/권역 이름, 없는 값은 None 으로 돌려준다."""
+
+    __slots__ = ("months", "fields", "_midx", "_cols", "_keys")
+
+    def __init__(self, months, fields):
+        self.months = tuple(sorted(months))
+        self.fields = tuple(fields)
+        self._midx = {m: i for i, m in enumerate(self.months)}
+        self._cols = {}
+        self._keys = {}
+
+    def put(self, key, field, month, value):
+        col = self._cols.get((key, field))
+        if col is None:
+            col = self._cols[(key, field)] = array("d", [NAN]) * len(self.months)
+            self._keys.setdefault(key, None)
+        i = self._midx.get(month)
+        if i is not None and value is not None:
+            col[i] = value
+
+    def keys(self):
+        return list(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def _field(self, field):
+        if field is None:
+            if len(self.fields) != 1:
+                raise ValueError(f"field required: {self.fields}")
+            return self.fields[0]
+        return field
+
+    def get(self, key, month, field=None):
+        col = self._cols.get((key, self._field(field)))
+        i = self._midx.get(month)
+        if col is None or i is None or isnan(col[i]):
+            return None
+        v = col[i]
+        return int(v) if v.is_integer() else v
+
+    def series(self, key, field=None):
+        """months 순서 값 리스트"""
+        col = self._cols.get((key, self._field(field)))
+        if col is None:
+            raise KeyError(key)
+        return [None if isnan(v) else (int(v) if v.is_integer() else v) for v in col]
+
+    def month(self, month, field=None):
+        """한 달의 {키: 값}"""
+        field = self._field(field)
+        return {k: self.get(k, month, field) for k in self._keys}
+
+class Table:
+    """레코드 리스트 -> 컬럼별 리스트 + 구별 행 번호 인덱스"""
+
+    __slots__ = ("columns", "_data", "_by_district")
+
+    def __init__(self, rows, columns, district_key="district"):
+        self.columns = tuple(columns)
+        self._data = {c: [r.get(c) for r in rows] for c in self.columns}
+        self._by_district = {}
+        for i, gu in enumerate(self._data.get(district_key, ())):
+            self._by_district.setdefault(gu, array("I")).append(i)
+
+    def __len__(self):
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def column(self, name):
+        return self._data[name]
+
+    def row(self, i):
+        return {c: self._data[c][i] for c in self.columns}
+
+    def districts(self):
+        return list(self._by_district)
+
+    def count(self, district):
+        return len(self._by_district.get(district, ()))
+
+    def by_district(self, district):
+        return [self.row(i) for i in self._by_district.get(district, ())]
+
+    def where(self, district=None, **eq):
+        """where(district="강남구", stage="조합설립인가") - 조건 모두 일치하는 행"""
+        idx = self._by_district.get(district, ()) if district else range(len(self))
+        cols = [(self._data[c], v) for c, v in eq.items()]
+        return [self.row(i) for i in idx if all(col[i] == v for col, v in cols)]
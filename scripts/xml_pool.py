@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""MOLIT 전월세 XML 병렬 파싱 - 프로세스 풀 + struct 패킹 레코드
+
+응답 원문(bytes)을 워커 프로세스에 넘기고, 워커는 dict 리스트 대신
+(보증금 int32, 월세 int32, 면적 float32) 12바이트 레코드를 이어붙인 bytes 를 돌려준다.
+IPC 로 오가는 건 원문 + 압축된 결과뿐이라 코어 수만큼 처리량이 늘어난다.
+
+  python xml_pool.py bench [--rows 5000] [--payloads 32]   합성 5000건 응답으로 직렬/풀 비교
+"""
+
+import os, struct, sys, time, xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+RENT_RECORD = struct.Struct("<iif")   # deposit, monthly, area
+
+def parse_rent_xml(raw):
+    """전월세 응답 XML -> 패킹된 레코드 bytes (보증금/면적 없는 행, 숫자 아닌 행은 버림)"""
+    root = ET.fromstring(raw)
+    out = bytearray()
+    pack = RENT_RECORD.pack
+    for item in root.iter("item"):
+        deposit = monthly = area = None
+        for child in item:
+            tag = child.tag
+            if tag == "deposit":
+                deposit = child.text
+            elif tag == "monthlyRent":
+                monthly = child.text
+            elif tag == "excluUseAr":
+                area = child.text
+        if not deposit or not area:
+            continue
+        deposit = deposit.strip().replace(",", "")
+        monthly = monthly.strip().replace(",", "") if monthly else ""
+        area = area.strip()
+        if not deposit or not area:
+            continue
+        try:
+            out += pack(int(deposit), int(monthly) if monthly else 0, float(area))
+        except (ValueError, struct.error):
+            pass
+    return bytes(out)
+
+def unpack_rent(buf):
+    """패킹된 레코드 -> [(deposit, monthly, area), ...]"""
+    return [(d, m, round(a, 4)) for d, m, a in RENT_RECORD.iter_unpack(buf)]
+
+class ParserPool:
+    """with ParserPool() as pool: fut = pool.submit(raw) -> fut.result() 는 패킹된 bytes"""
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+
+    def __enter__(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc):
+        self._pool.shutdown()
+
+    def submit(self, raw):
+        return self._pool.submit(parse_rent_xml, raw)
+
+    def map(self, raws, chunksize=1):
+        return self._pool.map(parse_rent_xml, raws, chunksize=chunksize)
+
+# ── 벤치마크 ──
+
+def synthetic_payload(rows, seed=0):
+    parts = ['<?xml version="1.0" encoding="UTF-8"?><response><header><resultCode>000</resultCode></header><body><items>']
+    for i in range(rows):
+        k = i + seed
+        monthly = 0 if k % 3 else 50 + k % 150
+        parts.append(
+            "<item><aptNm>테스트아파트</aptNm><buildYear>2005</buildYear><dealDay>%d</dealDay>"
+            "<dealMonth>1</dealMonth><dealYear>2025</dealYear><deposit>%s</deposit>"
+            "<excluUseAr>%.2f</excluUseAr><floor>%d</floor><jibun>%d</jibun>"
+            "<monthlyRent>%d</monthlyRent><sggCd>11680</sggCd><umdNm>역삼동</umdNm></item>"
+            % (1 + k % 28, f"{10000 + k * 7 % 90000:,}", 30 + k % 120 + 0.37, 1 + k % 30, k % 900, monthly)
+        )
+    parts.append("</items><numOfRows>%d</numOfRows><totalCount>%d</totalCount></body></response>" % (rows, rows))
+    return "".join(parts).encode("utf-8")
+
+def bench(rows=5000, payloads=32, workers=None):
+    raws = [synthetic_payload(rows, seed=i) for i in range(payloads)]
+    mb = sum(len(r) for r in raws) / 1e6
+    print(f"payloads: {payloads} x {rows} rows ({mb:.1f} MB)")
+
+    t0 = time.perf_counter()
+    serial = [parse_rent_xml(r) for r in raws]
+    ts = time.perf_counter() - t0
+    print(f"  serial     : {ts:.2f}s  {payloads * rows / ts:,.0f} rows/s")
+
+    with ParserPool(workers) as pool:
+        list(pool.map(raws[:pool.workers]))   # 워커 기동 비용은 제외
+        t0 = time.perf_counter()
+        pooled = list(pool.map(raws))
+        tp = time.perf_counter() - t0
+        print(f"  pool x{pool.workers:<3}  : {tp:.2f}s  {payloads * rows / tp:,.0f} rows/s  ({ts / tp:.1f}x)")
+
+    assert serial == pooled
+    print(f"  result     : {sum(len(b) for b in pooled):,} bytes packed ({RENT_RECORD.size} B/row)")
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] != "bench":
+        print("usage: xml_pool.py bench [--rows N] [--payloads N] [--workers N]")
+        sys.exit(1)
+    opt = lambda name, default: int(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+    bench(opt("--rows", 5000), opt("--payloads", 32), opt("--workers", None))
+
+if __name__ == "__main__":
+    main()